@@ -1,11 +1,9 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime
-import json
-import time
+import orjson
+import os
 
 # Configure page
 st.set_page_config(
@@ -16,7 +14,7 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
+CUSTOM_CSS = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -54,143 +52,307 @@ st.markdown("""
         box-shadow: 0 5px 15px rgba(0,0,0,0.1);
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Injected on every run: Streamlit drops elements a rerun does not re-emit
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+# HTML card templates, filled with str.format_map
+WAITING_CARD_TEMPLATE = """
+<div class="winner-card">
+    <h2>🎮 READY TO RACE!</h2>
+    <h1>{participants} Participants Ready</h1>
+    <h3>Waiting for the first race...</h3>
+    <p>🎯 Press SPACE in the game to start the countdown!</p>
+    <p>🏁 Results will appear here after the race finishes</p>
+    <small>Dashboard will auto-update with real race data</small>
+</div>
+"""
+
+SEARCH_CARD_TEMPLATE = """
+<div class="metric-card" style="margin: 1rem 0; padding: 1.5rem;">
+    <h3>🏆 Rank #{rank} - @{username}</h3>
+    <h4>{full_name}</h4>
+</div>
+"""
+
+PERFORMANCE_COLUMNS = ['Rank', 'Username', 'Race Time (s)', 'Speed (km/h)', 'Boosts Used']
+SEARCH_COLUMNS = ['Rank', 'Username', 'Full Name', 'Race Time (s)', 'Speed (km/h)',
+                  'Boosts Used', 'Collisions']
+RESULTS_COLUMNS = ['Rank', 'Username', 'Full Name', 'Race Time (s)', 'Speed (km/h)',
+                   'Boosts Used', 'Collisions', 'Distance Covered (km)']
+
+@st.cache_data(ttl=10, show_spinner=False)
+def _load_race_data_cached(latest_path, latest_mtime, backup_path, backup_ctime):
+    """Parse race results into a DataFrame plus metadata.
+
+    The file times are only used as cache keys so an unchanged results file is
+    not re-parsed on every rerun. Returns ``(df, metadata, messages, lookups)``
+    where ``messages`` are the status lines to show in the sidebar and
+    ``lookups`` holds search/filter structures derived once per file state.
+    """
+    race_data = None
+    data_source = "Unknown"
+    messages = []
+    
+    # Method 1: Try to load from the dedicated latest results file
+    if latest_path:
+        try:
+            with open(latest_path, 'rb') as f:
+                latest_data = orjson.loads(f.read())
+            
+            if latest_data.get('status') == 'completed' and 'results' in latest_data:
+                race_data = latest_data
+                data_source = "Latest Results (Real-time)"
+                messages.append("✅ Loading from real-time results file")
+            else:
+                messages.append("⏳ Latest results file exists but no race completed yet")
+        except Exception as e:
+            messages.append(f"⚠️ Error reading latest results: {e}")
+    
+    # Method 2: Fallback to race result files
+    if not race_data and backup_path:
+        messages.append(f"Loading: {backup_path}")
+        data_source = f"Backup File: {os.path.basename(backup_path)}"
+        
+        with open(backup_path, 'rb') as f:
+            race_data = orjson.loads(f.read())
+    
+    if race_data:
+        source_mtime = latest_mtime if data_source == "Latest Results (Real-time)" else backup_ctime
+        
+        # Convert race results to DataFrame
+        df = pd.DataFrame(race_data['results'])
+        
+        # Rename columns to match expected format
+        df = df.rename(columns={
+            'username': 'Username',
+            'fullName': 'Full Name',
+            'raceTime': 'Race Time (s)',
+            'averageSpeed': 'Speed (km/h)',
+            'boostsUsed': 'Boosts Used',
+            'collisions': 'Collisions',
+            'distanceCovered': 'Distance Covered (km)',
+            'rank': 'Rank'
+        })
+        
+        # Keep only the displayed columns so tables never ship raw JSON fields
+        df = df.reindex(columns=RESULTS_COLUMNS)
+        
+        # A results file of all-null times parses as an object column of None
+        df['Race Time (s)'] = pd.to_numeric(df['Race Time (s)'], errors='coerce')
+        
+        # Narrow numeric dtypes halve the bytes touched by the reductions.
+        # Race Time stays float64: averages and diffs of it are shown to 2
+        # decimals, where float32 error flips values at .xx5 boundaries.
+        df = df.astype({
+            'Speed (km/h)': 'float32',
+            'Distance Covered (km)': 'float32'
+        })
+        df['Boosts Used'] = df['Boosts Used'].fillna(0).astype('int16')
+        df['Collisions'] = df['Collisions'].fillna(0).astype('int16')
+        if df['Rank'].notna().all():
+            df['Rank'] = df['Rank'].astype('int32')
+        
+        # Canonical rank order so downstream head()/iloc slices need no re-sort
+        df = df.sort_values('Rank', kind='stable').reset_index(drop=True)
+        
+        # Arrow-backed strings so the cleanup runs in Arrow's compute kernels
+        df['Username'] = df['Username'].astype('string[pyarrow]')
+        df['Full Name'] = df['Full Name'].astype('string[pyarrow]')
+        
+        # Clean username format (remove @ if present)
+        df['Username'] = df['Username'].str.replace('@', '', regex=False)
+        
+        # Add race metadata for display
+        metadata = {
+            'race_date': race_data.get('raceDate', 'Unknown'),
+            'race_time': race_data.get('raceTime', 'Unknown'),
+            'race_duration': race_data.get('actualDuration', 0),
+            'total_participants': race_data.get('totalParticipants', 0),
+            'finishers': race_data.get('finishers', 0),
+            'winner': race_data.get('winner', {}),
+            'race_id': race_data.get('raceId', 'Unknown'),
+            'data_source': data_source,
+            'last_updated': race_data.get('timestamp', 'Unknown'),
+            'source_mtime': source_mtime
+        }
+        
+        # Sorted race times and their mean for search percentile lookups, and
+        # the row positions in time order (missing times last) for range filters
+        all_times = df['Race Time (s)'].to_numpy(dtype=float)
+        time_order = np.argsort(all_times, kind='stable')
+        times = all_times[~np.isnan(all_times)]
+        lookups = {
+            'usernames_lc': df['Username'].str.lower(),
+            'time_order': time_order,
+            'times_sorted': all_times[time_order[:len(times)]],
+            'avg_time': float(times.mean()) if len(times) else float('nan')
+        }
+        
+        # Race mode only when at least one racer has a time
+        metadata['has_race_data'] = len(times) > 0
+        
+        messages.append(f"✅ Loaded race data with {len(df)} results from {data_source}")
+        return df, metadata, messages, lookups
+    
+    # Fallback: Load CSV and show as participant list (no race data yet)
+    df = pd.read_csv(
+        'instaExport-2025-08-16T08_51_29.380Z.csv',
+        engine='pyarrow',
+        dtype_backend='pyarrow',
+        usecols=['Username', 'Full Name'],
+        dtype={'Username': 'string[pyarrow]', 'Full Name': 'string[pyarrow]'}
+    )
+    
+    # Clean and process the data
+    df['Username'] = df['Username'].str.strip()
+    df['Full Name'] = df['Full Name'].fillna(df['Username'])
+    
+    # Participant list only needs a position; race stat columns stay absent
+    df['Rank'] = np.arange(1, len(df) + 1, dtype=np.int32)
+    
+    # Indicate no race data available
+    metadata = {
+        'race_date': 'No race yet',
+        'race_time': 'Waiting for first race...',
+        'race_duration': 0,
+        'total_participants': len(df),
+        'finishers': 0,
+        'winner': {},
+        'race_id': 'No race data',
+        'data_source': 'CSV participant list',
+        'last_updated': 'Never',
+        'source_mtime': None,
+        'has_race_data': False
+    }
+    
+    lookups = {'usernames_lc': df['Username'].str.lower()}
+    
+    messages.append("❌ No race files found - showing participants")
+    return df, metadata, messages, lookups
+
+def has_race_results(metadata):
+    """Return True if the loaded data holds race results rather than the participant list"""
+    return metadata.get('has_race_data', False)
+
+def _race_signature(metadata):
+    """Return what identifies the race shown, to detect when new results arrive"""
+    return (metadata.get('race_id'), metadata.get('last_updated'),
+            metadata.get('data_source'), metadata.get('source_mtime'))
+
+@st.cache_data(ttl=10, show_spinner=False)
+def _latest_results_completed(latest_path, latest_mtime):
+    """Return True if the real-time results file holds a completed race.
+
+    Keyed on the file mtime, so the file is only parsed once per change.
+    """
+    try:
+        with open(latest_path, 'rb') as f:
+            latest_data = orjson.loads(f.read())
+    except Exception:
+        return False
+    return latest_data.get('status') == 'completed' and 'results' in latest_data
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _find_latest_race_file():
+    """Return ``(path, ctime, count)`` for the newest backup race results file.
+
+    Uses a single ``os.scandir`` pass that keeps the running max ctime,
+    avoiding ``glob``'s pattern matching and the duplicate getctime/getmtime
+    stats; each matching entry is still stat'ed once for its ctime.
+    """
+    latest_path, latest_ctime, count = None, None, 0
+    with os.scandir('.') as entries:
+        for entry in entries:
+            name = entry.name
+            if not (name.startswith('rocket_race_results_') and name.endswith('.json')):
+                continue
+            count += 1
+            ctime = entry.stat().st_ctime
+            if latest_ctime is None or ctime > latest_ctime:
+                latest_path, latest_ctime = name, ctime
+    return latest_path, latest_ctime, count
+
+def _current_race_data():
+    """Stat the results files and return the cached ``(df, metadata, messages, lookups)``"""
+    latest_path, latest_mtime = None, None
+    
+    latest_results_file = 'latest_race_results.json'
+    try:
+        latest_mtime = os.stat(latest_results_file).st_mtime
+        latest_path = latest_results_file
+    except FileNotFoundError:
+        pass
+    
+    # Fast path: a completed real-time file means no backup scan is needed
+    if latest_path and _latest_results_completed(latest_path, latest_mtime):
+        return _load_race_data_cached(latest_path, latest_mtime, None, None)
+    
+    # Use the most recent race file as the fallback
+    backup_path, backup_ctime, race_file_count = _find_latest_race_file()
+    
+    df, metadata, messages, lookups = _load_race_data_cached(
+        latest_path, latest_mtime, backup_path, backup_ctime
+    )
+    # Report the scan after the latest-file status line, as it happens after it
+    scan_at = 1 if latest_path else 0
+    messages = messages[:scan_at] + [f"Debug: Found {race_file_count} race files"] + messages[scan_at:]
+    return df, metadata, messages, lookups
 
 def load_race_data():
     """Load and process race data from latest results file or fallback sources"""
     try:
-        import glob
-        import os
-        
-        race_data = None
-        data_source = "Unknown"
-        
-        # Method 1: Try to load from the dedicated latest results file
-        latest_results_file = 'latest_race_results.json'
-        if os.path.exists(latest_results_file):
-            try:
-                with open(latest_results_file, 'r') as f:
-                    latest_data = json.load(f)
-                
-                if latest_data.get('status') == 'completed' and 'results' in latest_data:
-                    race_data = latest_data
-                    data_source = "Latest Results (Real-time)"
-                    st.sidebar.write(f"✅ Loading from real-time results file")
-                else:
-                    st.sidebar.write(f"⏳ Latest results file exists but no race completed yet")
-            except Exception as e:
-                st.sidebar.write(f"⚠️ Error reading latest results: {e}")
-        
-        # Method 2: Fallback to race result files
-        if not race_data:
-            race_files = glob.glob('rocket_race_results_*.json')
-            st.sidebar.write(f"Debug: Found {len(race_files)} race files")
-            
-            if race_files:
-                # Use the most recent race file
-                latest_file = max(race_files, key=os.path.getctime)
-                st.sidebar.write(f"Loading: {latest_file}")
-                data_source = f"Backup File: {os.path.basename(latest_file)}"
-                
-                with open(latest_file, 'r') as f:
-                    race_data = json.load(f)
+        df, metadata, messages, lookups = _current_race_data()
         
-        if race_data:
-            # Convert race results to DataFrame
-            df = pd.DataFrame(race_data['results'])
-            
-            # Rename columns to match expected format
-            df = df.rename(columns={
-                'username': 'Username',
-                'fullName': 'Full Name',
-                'raceTime': 'Race Time (s)',
-                'averageSpeed': 'Speed (km/h)',
-                'boostsUsed': 'Boosts Used',
-                'collisions': 'Collisions',
-                'distanceCovered': 'Distance Covered (km)',
-                'rank': 'Rank'
-            })
-            
-            # Clean username format (remove @ if present)
-            df['Username'] = df['Username'].str.replace('@', '', regex=False)
-            
-            # Add race metadata for display
-            st.session_state.race_metadata = {
-                'race_date': race_data.get('raceDate', 'Unknown'),
-                'race_time': race_data.get('raceTime', 'Unknown'),
-                'race_duration': race_data.get('actualDuration', 0),
-                'total_participants': race_data.get('totalParticipants', 0),
-                'finishers': race_data.get('finishers', 0),
-                'winner': race_data.get('winner', {}),
-                'race_id': race_data.get('raceId', 'Unknown'),
-                'data_source': data_source,
-                'last_updated': race_data.get('timestamp', 'Unknown')
-            }
-            
-            st.sidebar.write(f"✅ Loaded race data with {len(df)} results from {data_source}")
-            return df
-            
-        else:
-            # Fallback: Load CSV and show as participant list (no race data yet)
-            df = pd.read_csv('instaExport-2025-08-16T08_51_29.380Z.csv')
-            
-            # Clean and process the data
-            df['Username'] = df['Username'].str.strip()
-            df['Full Name'] = df['Full Name'].fillna(df['Username'])
-            
-            # Add placeholder columns for dashboard compatibility
-            df['Race Time (s)'] = np.nan
-            df['Speed (km/h)'] = np.nan
-            df['Boosts Used'] = 0
-            df['Collisions'] = 0
-            df['Distance Covered (km)'] = np.nan
-            df['Rank'] = range(1, len(df) + 1)
-            
-            # Indicate no race data available
-            st.session_state.race_metadata = {
-                'race_date': 'No race yet',
-                'race_time': 'Waiting for first race...',
-                'race_duration': 0,
-                'total_participants': len(df),
-                'finishers': 0,
-                'winner': {},
-                'race_id': 'No race data',
-                'data_source': 'CSV participant list',
-                'last_updated': 'Never'
-            }
-            
-            st.sidebar.write("❌ No race files found - showing participants")
-            return df
+        for message in messages:
+            st.sidebar.write(message)
+        
+        st.session_state.race_metadata = metadata
+        st.session_state.race_lookups = lookups
+        return df
             
     except Exception as e:
         st.error(f"Error loading data: {e}")
         st.sidebar.write(f"Error: {e}")
+        st.session_state.race_metadata = {}
+        st.session_state.race_lookups = {}
         return pd.DataFrame()
 
-@st.cache_data
+@st.cache_resource
 def load_image_mapping():
-    """Load image mapping data"""
+    """Load image mapping data.
+
+    The dict is shared by reference across all sessions, so callers must not
+    mutate it.
+    """
     try:
-        with open('image-mapping.json', 'r') as f:
-            return json.load(f)
+        with open('image-mapping.json', 'rb') as f:
+            return orjson.loads(f.read())
     except:
         return {}
 
+# Callers pass bounded head() slices, so hashing the whole input stays cheap
+_CHART_HASH_FUNCS = {
+    pd.DataFrame: lambda d: pd.util.hash_pandas_object(d, index=True).values.tobytes()
+}
+
+@st.cache_data(hash_funcs=_CHART_HASH_FUNCS, show_spinner=False)
 def create_ranking_chart(df, has_race_data=True):
-    """Create an interactive ranking chart"""
-    top_20 = df.head(20)
+    """Create an interactive ranking chart (pass ``df.head(20)``)"""
+    import plotly.graph_objects as go
     
     fig = go.Figure()
     
-    if has_race_data and not df['Race Time (s)'].isna().all():
+    if has_race_data:
         # Add bars for race times
         fig.add_trace(go.Bar(
-            x=top_20['Username'],
-            y=top_20['Race Time (s)'],
-            text=top_20['Rank'],
+            x=df['Username'],
+            y=df['Race Time (s)'],
+            text=df['Rank'],
             textposition='outside',
             marker=dict(
-                color=top_20['Race Time (s)'],
+                color=df['Race Time (s)'],
                 colorscale='RdYlGn_r',
                 showscale=True,
                 colorbar=dict(title="Race Time (s)")
@@ -202,7 +364,7 @@ def create_ranking_chart(df, has_race_data=True):
         ))
         
         fig.update_layout(
-            title="🏆 Top 20 Racers - Race Times",
+            title=f"🏆 Top {len(df)} Racers - Race Times",
             xaxis_title="Username",
             yaxis_title="Race Time (seconds)",
             height=500,
@@ -213,9 +375,9 @@ def create_ranking_chart(df, has_race_data=True):
     else:
         # Show participant list when no race data
         fig.add_trace(go.Bar(
-            x=top_20['Username'],
-            y=[1] * len(top_20),  # Equal height bars
-            text=top_20['Rank'],
+            x=df['Username'],
+            y=[1] * len(df),  # Equal height bars
+            text=df['Rank'],
             textposition='outside',
             marker=dict(
                 color='lightblue',
@@ -239,8 +401,11 @@ def create_ranking_chart(df, has_race_data=True):
     
     return fig
 
+@st.cache_data(hash_funcs=_CHART_HASH_FUNCS, show_spinner=False)
 def create_speed_vs_time_scatter(df):
-    """Create speed vs time scatter plot"""
+    """Create speed vs time scatter plot (pass ``df.head(50)``)"""
+    import plotly.express as px
+    
     fig = px.scatter(
         df.head(50), 
         x='Race Time (s)', 
@@ -256,7 +421,163 @@ def create_speed_vs_time_scatter(df):
     fig.update_layout(height=400, template="plotly_white")
     return fig
 
+FUN_FACT_COLUMNS = ['Boosts Used', 'Collisions', 'Distance Covered (km)', 'Speed (km/h)']
+
+def get_fun_fact_leaders(df):
+    """Return the leading row for each fun-fact column, indexed by column name"""
+    idxs = df[FUN_FACT_COLUMNS].idxmax()
+    leaders = df.loc[idxs.values]
+    leaders.index = idxs.index
+    return leaders
+
+# Numbers are formatted client-side so the underlying values stay exact
+RESULTS_COLUMN_CONFIG = {
+    'Race Time (s)': st.column_config.NumberColumn(format='%.2f'),
+    'Speed (km/h)': st.column_config.NumberColumn(format='%.1f'),
+    'Distance Covered (km)': st.column_config.NumberColumn(format='%.2f')
+}
+
+def filter_by_race_time(df, race_lookups, min_t, max_t):
+    """Return the rows of df within the race time range, in rank order"""
+    # Range filter via binary search on the loader's time-sorted positions
+    sorted_times = race_lookups['times_sorted']
+    start = np.searchsorted(sorted_times, min_t, side='left')
+    end = np.searchsorted(sorted_times, max_t, side='right')
+    return df.iloc[np.sort(race_lookups['time_order'][start:end])]
+
+def _is_fragment_tick(key):
+    """Return True when a fragment reruns on its own timer, not within a full app run"""
+    run_id = st.session_state.get('full_run_id', 0)
+    is_tick = st.session_state.get(key) == run_id
+    st.session_state[key] = run_id
+    return is_tick
+
+def render_live_sidebar_stats(df, race_metadata):
+    """Render the race statistics sidebar block.
+
+    Uses the data ``main()`` loaded on a full run and reloads only on its own
+    refresh ticks. Must be called inside ``with st.sidebar`` when run as a
+    fragment.
+    """
+    if _is_fragment_tick('sidebar_stats_run_id'):
+        try:
+            df, race_metadata, _, _ = _current_race_data()
+        except Exception:
+            return
+    
+    if df.empty:
+        return
+    
+    has_race_data = has_race_results(race_metadata)
+    
+    st.markdown("## 📊 Race Statistics")
+    st.metric("Total Participants", len(df))
+    
+    if has_race_data:
+        st.metric("Average Race Time", f"{df['Race Time (s)'].mean():.2f}s")
+        st.metric("Fastest Time", f"{df['Race Time (s)'].min():.2f}s")
+        st.metric("Total Boosts Used", df['Boosts Used'].sum())
+        st.metric("Race Duration", f"{race_metadata.get('race_duration', 0):.2f}s")
+        st.metric("Finishers", f"{race_metadata.get('finishers', 0)}/{race_metadata.get('total_participants', 0)}")
+        
+        # Show race details
+        st.markdown(f"""
+        ### 🏁 Race Info
+        **Date:** {race_metadata.get('race_date', 'Unknown')}  
+        **Time:** {race_metadata.get('race_time', 'Unknown')}  
+        **Race ID:** {race_metadata.get('race_id', 'Unknown')}  
+        **Data Source:** {race_metadata.get('data_source', 'Unknown')}  
+        **Last Updated:** {race_metadata.get('last_updated', 'Unknown')}
+        """)
+    else:
+        st.info("🎮 Run a race in the game to see live results!")
+        st.metric("Status", "Waiting for race...")
+        st.metric("Last Update", race_metadata.get('race_time', 'Never'))
+
+def render_live_race_section(df, race_metadata):
+    """Render the winner card, ranking chart and quick stats.
+
+    Uses the data ``main()`` loaded on a full run. On its own refresh ticks it
+    reloads, and new results (or data appearing after a failed load) trigger
+    a full app rerun so the static sections pick them up too.
+    """
+    if _is_fragment_tick('live_race_run_id'):
+        shown_metadata = race_metadata
+        
+        try:
+            df, race_metadata, _, _ = _current_race_data()
+        except Exception as e:
+            # Keep ticking; a half-written results file is usually fine next time
+            if shown_metadata:
+                st.error(f"Error loading data: {e}")
+            return
+        
+        if _race_signature(race_metadata) != _race_signature(shown_metadata):
+            st.rerun(scope="app")
+    
+    if df.empty:
+        return
+    
+    has_race_data = has_race_results(race_metadata)
+    
+    # Winner showcase or waiting message
+    if has_race_data and len(df) > 0:
+        winner = df.iloc[0]
+        with st.container(border=True):
+            st.markdown("#### 🏆 LATEST RACE WINNER ✈️")
+            st.subheader(f"🏆 @{winner['Username']}")
+            st.markdown(f"**{winner['Full Name']}**")
+            
+            cols = st.columns(4)
+            cols[0].metric("🕐 Race Time", f"{winner['Race Time (s)']:.2f}s")
+            cols[1].metric("⚡ Average Speed", f"{winner['Speed (km/h)']:.1f} km/h")
+            cols[2].metric("🚀 Boosts Used", f"{winner['Boosts Used']}")
+            cols[3].metric("💥 Collisions", f"{winner['Collisions']}")
+            
+            st.caption(f"Race Date: {race_metadata.get('race_date', 'Unknown')} at {race_metadata.get('race_time', 'Unknown')}")
+    else:
+        st.markdown(WAITING_CARD_TEMPLATE.format_map({'participants': len(df)}),
+                    unsafe_allow_html=True)
+    
+    # Main dashboard
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.plotly_chart(create_ranking_chart(df.head(20), has_race_data), use_container_width=True)
+    
+    with col2:
+        if has_race_data:
+            st.markdown("### 🎯 Quick Stats")
+            
+            # Top 3 podium
+            for i, racer in enumerate(df.head(3)[['Rank', 'Username', 'Race Time (s)']].to_dict('records')):
+                medal = ["🥇", "🥈", "🥉"][i]
+                with st.container(border=True):
+                    st.metric(f"{medal} Rank {racer['Rank']}", f"@{racer['Username']}")
+                    st.caption(f"{racer['Race Time (s)']:.2f}s")
+        else:
+            st.markdown("### 🎮 Instructions")
+            st.markdown("""
+            **How to start a race:**
+            1. Open `index.html` in your browser
+            2. Press **SPACE** to start countdown
+            3. Watch the epic rocket race!
+            4. Results will automatically save and appear here
+            
+            **Controls:**
+            - `SPACE` - Start race
+            - `R` - Reset race
+            """)
+            
+            st.markdown("### 👥 Participants Ready")
+            st.metric("Total Racers", len(df))
+            st.metric("Waiting for", "First race to start...")
+            st.info("🔄 Refresh this page after running a race to see results!")
+
 def main():
+    # Lets the live fragments tell a full run from their own refresh ticks
+    st.session_state.full_run_id = st.session_state.get('full_run_id', 0) + 1
+    
     # Header
     st.markdown('<h1 class="main-header">🚀 EPIC ROCKET RACE DASHBOARD</h1>', unsafe_allow_html=True)
     
@@ -268,44 +589,52 @@ def main():
     
     with col_auto:
         auto_refresh = st.checkbox("🔄 Auto-refresh", value=False, help="Automatically refresh every 10 seconds to check for new races")
-        if auto_refresh:
-            # Use Streamlit's built-in rerun capability with delay
-            time.sleep(10)
-            st.rerun()
+    
+    # Only the live sections rerun on the refresh tick
+    run_every = 10 if auto_refresh else None
     
     # Load data
     df = load_race_data()
+    race_metadata = getattr(st.session_state, 'race_metadata', {})
     image_mapping = load_image_mapping()
     
     if df.empty:
         st.error("Failed to load race data!")
+        # Keep polling so the dashboard recovers once results appear
+        st.fragment(run_every=run_every)(render_live_race_section)(df, race_metadata)
         return
     
     # Check if we have real race data
-    has_race_data = not df['Race Time (s)'].isna().all()
-    race_metadata = getattr(st.session_state, 'race_metadata', {})
+    has_race_data = has_race_results(race_metadata)
+    race_lookups = getattr(st.session_state, 'race_lookups', {})
     
-    # Search functionality
+    # Search functionality (forms so the filter only runs on submit, not per keystroke)
     with col_search:
-        search_username = st.text_input("🔍 Find Your Rank", 
-                                       placeholder="Enter your username...", 
-                                       help="Search for your username to see your rank instantly!")
+        with st.form("search_form", border=False):
+            search_username = st.text_input("🔍 Find Your Rank", 
+                                           placeholder="Enter your username...", 
+                                           help="Search for your username to see your rank instantly!")
+            st.form_submit_button("Search")
+    
+    # Lowercased once in the loader for case-insensitive substring search
+    usernames_lc = race_lookups['usernames_lc']
     
     # Show search results if user searched
     if search_username and has_race_data:
         # Search for the user (case insensitive, partial match)
-        search_results = df[df['Username'].str.contains(search_username, case=False, na=False)]
+        search_results = df[usernames_lc.str.contains(search_username.lower(), regex=False, na=False)]
         
         if not search_results.empty:
+            times_sorted = race_lookups['times_sorted']
+            avg_time = race_lookups['avg_time']
             st.success("🎯 **Search Results:**")
-            for _, user in search_results.iterrows():
+            for user in search_results[SEARCH_COLUMNS].to_dict('records'):
                 # Create a detailed card for each search result
-                st.markdown(f"""
-                <div class="metric-card" style="margin: 1rem 0; padding: 1.5rem;">
-                    <h3>🏆 Rank #{user['Rank']} - @{user['Username']}</h3>
-                    <h4>{user['Full Name']}</h4>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(SEARCH_CARD_TEMPLATE.format_map({
+                    'rank': user['Rank'],
+                    'username': user['Username'],
+                    'full_name': user['Full Name']
+                }), unsafe_allow_html=True)
                 
                 col1, col2, col3, col4, col5 = st.columns(5)
                 with col1:
@@ -330,9 +659,9 @@ def main():
                 
                 # Performance comparison
                 if len(df) > 1:
-                    avg_time = df['Race Time (s)'].mean()
                     time_diff = user['Race Time (s)'] - avg_time
-                    faster_than = ((df['Race Time (s)'] > user['Race Time (s)']).sum() / len(df)) * 100
+                    slower_count = len(times_sorted) - np.searchsorted(times_sorted, user['Race Time (s)'], side='right')
+                    faster_than = (slower_count / len(df)) * 100
                     
                     col_perf1, col_perf2 = st.columns(2)
                     with col_perf1:
@@ -348,23 +677,25 @@ def main():
             st.warning(f"❌ No racer found matching '{search_username}'. Try a different search term!")
     elif search_username and not has_race_data:
         # Search in participant list when no race data
-        search_results = df[df['Username'].str.contains(search_username, case=False, na=False)]
+        search_results = df[usernames_lc.str.contains(search_username.lower(), regex=False, na=False)]
         if not search_results.empty:
             st.info("🎮 **Participant Found - Ready to Race!**")
-            for _, user in search_results.iterrows():
+            for user in search_results[['Rank', 'Username', 'Full Name']].to_dict('records'):
                 st.write(f"👤 **@{user['Username']}** ({user['Full Name']}) - Position #{user['Rank']} in participant list")
         else:
             st.warning(f"❌ No participant found matching '{search_username}'.")
     
     # Sidebar search and stats
     st.sidebar.markdown("## 🔍 Quick Search")
-    sidebar_search = st.sidebar.text_input("Find Username", placeholder="Quick search...")
+    with st.sidebar.form("sidebar_search_form", border=False):
+        sidebar_search = st.text_input("Find Username", placeholder="Quick search...")
+        st.form_submit_button("Search")
     
     if sidebar_search:
-        search_results = df[df['Username'].str.contains(sidebar_search, case=False, na=False)]
+        search_results = df[usernames_lc.str.contains(sidebar_search.lower(), regex=False, na=False)]
         if not search_results.empty and has_race_data:
             st.sidebar.markdown("### 🎯 Results:")
-            for _, user in search_results.head(3).iterrows():  # Show top 3 matches
+            for user in search_results.head(3)[SEARCH_COLUMNS].to_dict('records'):  # Show top 3 matches
                 st.sidebar.markdown(f"""
                 **@{user['Username']}**  
                 🏆 Rank #{user['Rank']}  
@@ -374,120 +705,33 @@ def main():
                 """)
         elif not search_results.empty:
             st.sidebar.markdown("### 👥 Participants:")
-            for _, user in search_results.head(3).iterrows():
+            for user in search_results.head(3)[['Username']].to_dict('records'):
                 st.sidebar.markdown(f"**@{user['Username']}** - Ready!")
         else:
             st.sidebar.warning("No matches found")
     
-    st.sidebar.markdown("## 📊 Race Statistics")
-    st.sidebar.metric("Total Participants", len(df))
+    with st.sidebar:
+        st.fragment(run_every=run_every)(render_live_sidebar_stats)(df, race_metadata)
     
-    if has_race_data:
-        st.sidebar.metric("Average Race Time", f"{df['Race Time (s)'].mean():.2f}s")
-        st.sidebar.metric("Fastest Time", f"{df['Race Time (s)'].min():.2f}s")
-        st.sidebar.metric("Total Boosts Used", df['Boosts Used'].sum())
-        st.sidebar.metric("Race Duration", f"{race_metadata.get('race_duration', 0):.2f}s")
-        st.sidebar.metric("Finishers", f"{race_metadata.get('finishers', 0)}/{race_metadata.get('total_participants', 0)}")
-        
-        # Show race details
-        st.sidebar.markdown(f"""
-        ### 🏁 Race Info
-        **Date:** {race_metadata.get('race_date', 'Unknown')}  
-        **Time:** {race_metadata.get('race_time', 'Unknown')}  
-        **Race ID:** {race_metadata.get('race_id', 'Unknown')}  
-        **Data Source:** {race_metadata.get('data_source', 'Unknown')}  
-        **Last Updated:** {race_metadata.get('last_updated', 'Unknown')}
-        """)
-    else:
-        st.sidebar.info("🎮 Run a race in the game to see live results!")
-        st.sidebar.metric("Status", "Waiting for race...")
-        st.sidebar.metric("Last Update", race_metadata.get('race_time', 'Never'))
-    
-    # Winner showcase or waiting message
-    if has_race_data and len(df) > 0:
-        winner = df.iloc[0]
-        st.markdown(f"""
-        <div class="winner-card">
-            <h2>🏆 LATEST RACE WINNER ✈️</h2>
-            <h1>@{winner['Username']}</h1>
-            <h3>{winner['Full Name']}</h3>
-            <p>🕐 Race Time: {winner['Race Time (s)']:.2f} seconds</p>
-            <p>⚡ Average Speed: {winner['Speed (km/h)']:.1f} km/h</p>
-            <p>🚀 Boosts Used: {winner['Boosts Used']}</p>
-            <p>💥 Collisions: {winner['Collisions']}</p>
-            <small>Race Date: {race_metadata.get('race_date', 'Unknown')} at {race_metadata.get('race_time', 'Unknown')}</small>
-        </div>
-        """, unsafe_allow_html=True)
-    else:
-        st.markdown(f"""
-        <div class="winner-card">
-            <h2>🎮 READY TO RACE!</h2>
-            <h1>{len(df)} Participants Ready</h1>
-            <h3>Waiting for the first race...</h3>
-            <p>🎯 Press SPACE in the game to start the countdown!</p>
-            <p>🏁 Results will appear here after the race finishes</p>
-            <small>Dashboard will auto-update with real race data</small>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Main dashboard
-    col1, col2 = st.columns([2, 1])
-    
-    with col1:
-        st.plotly_chart(create_ranking_chart(df, has_race_data), use_container_width=True)
-    
-    with col2:
-        if has_race_data:
-            st.markdown("### 🎯 Quick Stats")
-            
-            # Top 3 podium
-            for i, (_, racer) in enumerate(df.head(3).iterrows()):
-                medal = ["🥇", "🥈", "🥉"][i]
-                st.markdown(f"""
-                <div class="metric-card">
-                    <h4>{medal} Rank {racer['Rank']}</h4>
-                    <h3>@{racer['Username']}</h3>
-                    <p>{racer['Race Time (s)']:.2f}s</p>
-                </div>
-                """, unsafe_allow_html=True)
-        else:
-            st.markdown("### 🎮 Instructions")
-            st.markdown("""
-            **How to start a race:**
-            1. Open `index.html` in your browser
-            2. Press **SPACE** to start countdown
-            3. Watch the epic rocket race!
-            4. Results will automatically save and appear here
-            
-            **Controls:**
-            - `SPACE` - Start race
-            - `R` - Reset race
-            """)
-            
-            st.markdown("### 👥 Participants Ready")
-            st.metric("Total Racers", len(df))
-            st.metric("Waiting for", "First race to start...")
-            st.info("🔄 Refresh this page after running a race to see results!")
+    # Winner card, ranking chart and quick stats refresh on their own
+    st.fragment(run_every=run_every)(render_live_race_section)(df, race_metadata)
     
     # Second row
     if has_race_data:
         col3, col4 = st.columns(2)
         
         with col3:
-            st.plotly_chart(create_speed_vs_time_scatter(df), use_container_width=True)
+            st.plotly_chart(create_speed_vs_time_scatter(df.head(50)), use_container_width=True)
         
         with col4:
             # Performance breakdown
             st.markdown("### 🔥 Performance Breakdown")
             
-            performance_df = df.head(10)[['Rank', 'Username', 'Race Time (s)', 'Speed (km/h)', 'Boosts Used']].copy()
-            performance_df['Race Time (s)'] = performance_df['Race Time (s)'].round(2)
-            performance_df['Speed (km/h)'] = performance_df['Speed (km/h)'].round(1)
-            
             st.dataframe(
-                performance_df,
+                df.head(10)[PERFORMANCE_COLUMNS],
                 use_container_width=True,
-                hide_index=True
+                hide_index=True,
+                column_config=RESULTS_COLUMN_CONFIG
             )
     else:
         # Show participant preview when no race data
@@ -526,24 +770,17 @@ def main():
                                float(df['Race Time (s)'].max()), 
                                float(df['Race Time (s)'].max()))
         
-        # Filter data
-        filtered_df = df[(df['Race Time (s)'] >= min_time) & (df['Race Time (s)'] <= max_time)]
+        # Filter and display rankings
+        filtered_df = filter_by_race_time(df, race_lookups, min_time, max_time)
         
         if show_top != "All":
             filtered_df = filtered_df.head(show_top)
         
-        # Display rankings
-        display_df = filtered_df[['Rank', 'Username', 'Full Name', 'Race Time (s)', 'Speed (km/h)', 
-                                 'Boosts Used', 'Collisions', 'Distance Covered (km)']].copy()
-        
-        display_df['Race Time (s)'] = display_df['Race Time (s)'].round(2)
-        display_df['Speed (km/h)'] = display_df['Speed (km/h)'].round(1)
-        display_df['Distance Covered (km)'] = display_df['Distance Covered (km)'].round(2)
-        
         st.dataframe(
-            display_df,
+            filtered_df,
             use_container_width=True,
-            hide_index=True
+            hide_index=True,
+            column_config=RESULTS_COLUMN_CONFIG
         )
     else:
         st.markdown("## 📋 All Participants")
@@ -560,7 +797,7 @@ def main():
         # Filter data
         filtered_df = df.copy()
         if search_term:
-            filtered_df = filtered_df[filtered_df['Username'].str.contains(search_term, case=False, na=False)]
+            filtered_df = filtered_df[usernames_lc.str.contains(search_term.lower(), regex=False, na=False)]
         
         if show_top != "All":
             filtered_df = filtered_df.head(show_top)
@@ -579,28 +816,29 @@ def main():
     if has_race_data:
         st.markdown("## 🎉 Fun Race Facts")
         
+        leaders = get_fun_fact_leaders(df)
         col8, col9, col10, col11 = st.columns(4)
         
         with col8:
-            fastest_booster = df.loc[df['Boosts Used'].idxmax()]
+            fastest_booster = leaders.loc['Boosts Used']
             st.metric("🚀 Most Boosts Used", 
                      f"@{fastest_booster['Username']}", 
                      f"{fastest_booster['Boosts Used']} boosts")
         
         with col9:
-            crash_king = df.loc[df['Collisions'].idxmax()]
+            crash_king = leaders.loc['Collisions']
             st.metric("💥 Most Collisions", 
                      f"@{crash_king['Username']}", 
                      f"{crash_king['Collisions']} crashes")
         
         with col10:
-            distance_leader = df.loc[df['Distance Covered (km)'].idxmax()]
+            distance_leader = leaders.loc['Distance Covered (km)']
             st.metric("🛣️ Longest Distance", 
                      f"@{distance_leader['Username']}", 
                      f"{distance_leader['Distance Covered (km)']:.2f} km")
         
         with col11:
-            speed_demon = df.loc[df['Speed (km/h)'].idxmax()]
+            speed_demon = leaders.loc['Speed (km/h)']
             st.metric("⚡ Highest Speed", 
                      f"@{speed_demon['Username']}", 
                      f"{speed_demon['Speed (km/h)']:.1f} km/h")